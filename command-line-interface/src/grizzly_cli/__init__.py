@@ -2,20 +2,15 @@
 
 from __future__ import annotations
 
-from importlib.metadata import PackageNotFoundError, version
+from math import inf
+from operator import itemgetter
 from os import environ
 from pathlib import Path
 from typing import TYPE_CHECKING, ClassVar
 
-try:
-    __version__ = version('grizzly-loadtester-cli')
-except PackageNotFoundError:
-    __version__ = 'unkown'
+from grizzly_common.__version__ import __version__ as __common_version__
 
-try:
-    __common_version__ = version('grizzly-loadtester-common')
-except PackageNotFoundError:
-    __common_version__ = 'unknown'
+from grizzly_cli.__version__ import __version__
 
 if TYPE_CHECKING:  # pragma: no cover
     from collections.abc import Callable
@@ -38,19 +33,22 @@ FEATURE_DESCRIPTION: str | None = None
 
 
 class register_parser:
-    registered: ClassVar[list[Callable[[ArgumentSubParser], None]]] = []
+    registered: ClassVar[list[tuple[float, int, Callable[[ArgumentSubParser], None]]]] = []
     order: int | None
 
     def __init__(self, order: int | None = None) -> None:
         self.order = order
 
     def __call__(self, func: Callable[[ArgumentSubParser], None]) -> Callable[[ArgumentSubParser], None]:
-        if self.order is not None:
-            self.registered.insert(self.order - 1, func)
-        else:
-            self.registered.append(func)
+        # parsers without order are added after the ordered ones, in registration order
+        order = self.order if self.order is not None else inf
+        self.registered.append((order, len(self.registered), func))
 
         return func
 
+    @classmethod
+    def parsers(cls) -> list[Callable[[ArgumentSubParser], None]]:
+        return [func for _, _, func in sorted(cls.registered, key=itemgetter(0, 1))]
+
 
 __all__ = ['__common_version__', '__version__']
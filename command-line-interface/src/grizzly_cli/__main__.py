@@ -53,7 +53,7 @@ def _create_parser() -> ArgumentParser:
 
     sub_parser = parser.add_subparsers(dest='command')
 
-    for create_parser in register_parser.registered:
+    for create_parser in register_parser.parsers():
         create_parser(sub_parser)
 
     return parser
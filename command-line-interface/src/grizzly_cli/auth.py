@@ -17,7 +17,7 @@ if TYPE_CHECKING:  # pragma: no cover
     from grizzly_cli.argparse import ArgumentSubParser
 
 
-@register_parser()
+@register_parser(order=3)
 def create_parser(sub_parser: ArgumentSubParser) -> None:
     # grizzly-cli auth
     auth_parser = sub_parser.add_parser('auth', description=('grizzly stateless authenticator application'))
@@ -33,7 +33,7 @@ if TYPE_CHECKING:  # pragma: no cover
     from grizzly_cli.argparse import ArgumentSubParser
 
 
-@register_parser(order=3)
+@register_parser(order=4)
 def create_parser(sub_parser: ArgumentSubParser) -> None:
     dist_parser = sub_parser.add_parser('dist', description='commands for running grizzly i distributed mode.')
 
@@ -26,7 +26,6 @@ from shutil import rmtree, which
 from tempfile import mkdtemp
 from typing import TYPE_CHECKING, Any, ClassVar, Union, cast
 
-import requests
 import tomli
 from behave.parser import parse_file as feature_file_parser
 from jinja2 import Template
@@ -199,6 +198,9 @@ def get_dependency_versions(*, local_install: Union[bool, str]) -> tuple[tuple[s
     grizzly_version: str | None = None
     grizzly_extras: list[str] | None = None
 
+    # requests is slow to import, and only needed when looking up versions
+    import requests  # noqa: PLC0415
+
     args: tuple[str, ...] = ()
     if isinstance(local_install, str):
         args += (local_install,)
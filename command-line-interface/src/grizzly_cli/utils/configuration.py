@@ -15,8 +15,6 @@ from textwrap import dedent
 from typing import TYPE_CHECKING, ClassVar, cast
 
 import yaml
-from azure.identity import AzureCliCredential, ChainedTokenCredential, ManagedIdentityCredential
-from azure.keyvault.secrets import KeyVaultSecret, SecretClient
 from behave.parser import parse_feature
 from cryptography.hazmat.primitives import serialization
 from cryptography.hazmat.primitives._serialization import PBES, KeySerializationEncryption, KeySerializationEncryptionBuilder, PrivateFormat
@@ -30,6 +28,7 @@ from grizzly_cli.utils import IndentDumper, logger, merge_dicts, run_command, un
 if TYPE_CHECKING:  # pragma: no cover
     from collections.abc import Iterable
 
+    from azure.keyvault.secrets import KeyVaultSecret, SecretClient
     from behave.model import Scenario
     from cryptography.hazmat.primitives.asymmetric.types import PrivateKeyTypes
     from cryptography.x509 import Certificate
@@ -337,6 +336,10 @@ class MergeYamlTag(StandaloneTag):  # pragma: no cover
 
 
 def get_keyvault_client(url: str) -> SecretClient:
+    # azure sdk is slow to import, only pay for it when keyvault is actually used
+    from azure.identity import AzureCliCredential, ChainedTokenCredential, ManagedIdentityCredential  # noqa: PLC0415
+    from azure.keyvault.secrets import SecretClient  # noqa: PLC0415
+
     credential = ChainedTokenCredential(ManagedIdentityCredential(), AzureCliCredential())
 
     return SecretClient(vault_url=url, credential=credential)
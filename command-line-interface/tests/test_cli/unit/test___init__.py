@@ -12,7 +12,10 @@ from typing import TYPE_CHECKING
 from test_cli.helpers import cwd, rm_rf
 
 if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Callable
+
     from _pytest.tmpdir import TempPathFactory
+    from grizzly_cli.argparse import ArgumentSubParser
     from pytest_mock import MockerFixture
 
 
@@ -41,3 +44,25 @@ def test___import__(tmp_path_factory: TempPathFactory, mocker: MockerFixture) ->
 
         with suppress(KeyError):
             del environ['GRIZZLY_MOUNT_CONTEXT']
+
+
+def test_register_parser(mocker: MockerFixture) -> None:
+    from grizzly_cli import register_parser
+
+    mocker.patch.object(register_parser, 'registered', [])
+
+    def create_parser(name: str) -> Callable[[ArgumentSubParser], None]:
+        def _create_parser(_: ArgumentSubParser) -> None:
+            pass
+
+        _create_parser.__name__ = name
+
+        return _create_parser
+
+    register_parser()(create_parser('a'))
+    register_parser(order=3)(create_parser('b'))
+    register_parser(order=1)(create_parser('c'))
+    register_parser()(create_parser('d'))
+    register_parser(order=2)(create_parser('e'))
+
+    assert [func.__name__ for func in register_parser.parsers()] == ['c', 'e', 'b', 'a', 'd']
@@ -129,7 +129,7 @@ class TestScenarioTag:
 
 
 def test_get_keyvault_client(mocker: MockerFixture) -> None:
-    secrets_client_mock = mocker.patch('grizzly_cli.utils.configuration.SecretClient', return_value=MagicMock(spec=SecretClient))
+    secrets_client_mock = mocker.patch('azure.keyvault.secrets.SecretClient', return_value=MagicMock(spec=SecretClient))
 
     assert get_keyvault_client('https://grizzly.keyvault.azure.com') == secrets_client_mock.return_value
 
@@ -4,9 +4,9 @@ from __future__ import annotations
 
 import csv
 import logging
-import socket
 from contextlib import suppress
 from pathlib import Path
+from threading import Lock
 from time import time
 from typing import TYPE_CHECKING, Any, Literal
 
@@ -14,6 +14,7 @@ import gevent
 import requests
 from flask import Flask, jsonify, request
 from flask import Response as FlaskResponse
+from gevent.pool import Pool
 from gevent.pywsgi import WSGIServer
 from typing_extensions import Self
 
@@ -45,22 +46,35 @@ def app_get_cat_fact() -> FlaskResponse:
     return jsonify(['meow meow meow'])
 
 
+_books: dict[str, dict[str, str]] | None = None
+_books_lock = Lock()
+
+
+def _load_books() -> dict[str, dict[str, str]]:
+    global _books  # noqa: PLW0603
+
+    with _books_lock:
+        if _books is None:
+            books = Path.joinpath(Path.cwd(), 'features', 'requests', 'books', 'books.csv')
+            with books.open('r') as fd:
+                _books = {row['book']: row for row in csv.DictReader(fd)}
+
+    return _books
+
+
 @app.route('/books/<book>.json')
 def app_get_book(book: str) -> FlaskResponse:
-    books = Path.joinpath(Path.cwd(), 'features', 'requests', 'books', 'books.csv')
-    with books.open('r') as fd:
-        reader = csv.DictReader(fd)
-        for row in reader:
-            if row['book'] == book:
-                return jsonify(
-                    {
-                        'number_of_pages': row['pages'],
-                        'isbn_10': [row['isbn_10']] * 2,
-                        'authors': [
-                            {'key': '/author/' + row['author'].replace(' ', '_').strip() + '|' + row['isbn_10'].strip()},
-                        ],
-                    }
-                )
+    row = _load_books().get(book, None)
+    if row is not None:
+        return jsonify(
+            {
+                'number_of_pages': row['pages'],
+                'isbn_10': [row['isbn_10']] * 2,
+                'authors': [
+                    {'key': '/author/' + row['author'].replace(' ', '_').strip() + '|' + row['isbn_10'].strip()},
+                ],
+            }
+        )
 
     response = jsonify({'success': False})
     response.status_code = 500
@@ -79,19 +93,26 @@ def app_get_author(author_key: str) -> FlaskResponse:
     )
 
 
+# unknown routes responds with an empty json object, same response every time so only create it once
+not_found_response = app.response_class(b'{}', status=200, mimetype='application/json')
+
+
 @app.errorhandler(404)
 def catch_all(_: Any) -> FlaskResponse:
-    return jsonify({}, status=200)
+    return not_found_response
 
 
 class Webserver:
     _web_server: WSGIServer
+    _pool: Pool
 
     def __init__(self, port: int = 0) -> None:
+        self._pool = Pool(1000)
         self._web_server = WSGIServer(
             ('0.0.0.0', port),
             app,
             log=None,
+            spawn=self._pool,
         )
         logger.debug('created webserver on port %d', port)
 
@@ -102,17 +123,6 @@ class Webserver:
 
         return port  # type: ignore[no-any-return]
 
-    def wait_for_start(self, timeout: int = 10) -> None:
-        start_time = time()
-        while time() - start_time < timeout:
-            with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
-                if sock.connect_ex(('127.0.0.1', self.port)) == 0:
-                    return
-                gevent.sleep(0.5)
-
-        message = f'webserver did not start on port {self.port}'
-        raise RuntimeError(message)
-
     def wait_for_health(self, timeout: int = 300) -> None:
         start_time = time()
         while time() - start_time < timeout:
@@ -133,8 +143,8 @@ class Webserver:
             global logger  # noqa: PLW0603
             logger = logger_
 
-        gevent.spawn(lambda: self._web_server.serve_forever())
-        self.wait_for_start()
+        # binds the listener and starts accepting connections before returning, requests are handled by greenlets from the pool
+        self._web_server.start()
         self.wait_for_health()
         logger.debug('started webserver on port %d', self.port)
 
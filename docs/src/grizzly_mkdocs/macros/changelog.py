@@ -2,10 +2,11 @@
 
 from __future__ import annotations
 
+from itertools import pairwise
+
 from mkdocs_macros.util import trace
-from packaging.version import Version
 
-from grizzly_mkdocs.macros.command import command
+from grizzly_mkdocs.macros.command import command, stream_command
 
 
 def build_markdown_section(version: str, commits: list[str], repo_url: str, label: str | None) -> list[str]:
@@ -24,8 +25,52 @@ def build_markdown_section(version: str, commits: list[str], repo_url: str, labe
     return markdown
 
 
+def commits_per_version(tag_prefix: str, versions: list[str], pathspec: list[str], *, unreleased: bool) -> dict[str, list[str]]:
+    """Walk the history of all versions once, and group commits touching `pathspec` by the version they were released in.
+
+    A commit belongs to a version if it is reachable from that version, but not from the version before it, i.e. the
+    same commits as `git log <previous version>..<version>` would list. Commits reachable from the oldest version are not included.
+    """
+    revisions = [f'{tag_prefix}@{version}' for version in versions]
+    if unreleased:
+        revisions[0] = 'HEAD'
+
+    tips = command(['git', 'rev-parse', *[f'{revision}^{{commit}}' for revision in revisions]]).splitlines()
+    walk = [*revisions[:-1], f'^{revisions[-1]}']
+
+    lines = stream_command(['git', 'log', *walk, '--oneline', '--no-decorate', '--no-color', '--no-abbrev', '--no-merges', '--', *pathspec])
+    messages = dict(line.split(' ', 1) for line in lines)
+
+    # bit n is set for commits reachable from versions[n], children are always listed before their parents
+    # in topological order, so reachability can be propagated from the version tips in a single pass
+    reachable: dict[str, int] = {}
+    for index, tip in enumerate(tips):
+        reachable[tip] = reachable.get(tip, 0) | 1 << index
+
+    for line in stream_command(['git', 'rev-list', '--topo-order', '--parents', *walk]):
+        commit, *parents = line.split()
+        mask = reachable.get(commit, 0)
+
+        for parent in parents:
+            reachable[parent] = reachable.get(parent, 0) | mask
+
+    commits: dict[str, list[str]] = {}
+
+    for commit, message in messages.items():
+        mask = reachable.get(commit, 0)
+
+        for index, version in enumerate(versions[:-1]):
+            if mask >> index & 0b11 == 0b01:  # reachable from version, but not from the previous version
+                commits.setdefault(version, []).append(f'{commit} {message}')
+
+    return commits
+
+
 def changelog(package: str, tag_prefix: str) -> str:
-    tags = command(f"git tag | grep '^{tag_prefix}@v'").splitlines()
+    # let git filter and version sort tags, newest first. pre-release suffixes must be configured for them to be sorted
+    # before the final release, in the same order as PEP 440 (dev < a < b < rc)
+    versionsort = [option for suffix in ['.dev', 'a', 'b', 'rc'] for option in ['-c', f'versionsort.suffix={suffix}']]
+    tags = command(['git', *versionsort, 'tag', '--list', f'{tag_prefix}@v*', '--sort=-v:refname']).splitlines()
 
     git_remote, _ = command(['git', 'remote', '-v']).splitlines()
     _, git_remote, _ = git_remote.split(maxsplit=2)
@@ -35,38 +80,30 @@ def changelog(package: str, tag_prefix: str) -> str:
     trace(f'{package}: generating changelog for tag prefix "{tag_prefix}@"')
 
     head_version = command(['hatch', 'version'], cwd=package)
-    tags.append(f'v{head_version}')
+    head_marker = f'v{head_version}'
 
     # remove tag_prefix from all retrieved tags
     versions = [tag.removeprefix(f'{tag_prefix}@') for tag in tags]
-    versions.sort(reverse=True, key=Version)
+
+    # HEAD is the newest version, unless it is the latest release (e.g. when building release documentation)
+    unreleased = versions[:1] != [head_marker]
+    if unreleased:
+        versions.insert(0, head_marker)
+
+    if len(versions) < 2:
+        return ''
 
     markdown_changelog: list[str] = []
 
-    for index, version in enumerate(versions[1:], start=1):
-        previous_tag = f'{tag_prefix}@{version}'
-        current_version = versions[index - 1]
-        current_tag = f'{tag_prefix}@{current_version}' if current_version != f'v{head_version}' else 'HEAD'
+    commits = commits_per_version(tag_prefix, versions, [f'{package}/*', f'{package}/src/**/*', f'{package}/tests/**/*'], unreleased=unreleased)
+
+    for index, (current_version, previous_version) in enumerate(pairwise(versions), start=1):
+        previous_tag = f'{tag_prefix}@{previous_version}'
+        current_tag = 'HEAD' if unreleased and index == 1 else f'{tag_prefix}@{current_version}'
 
         trace(f'generating changelog for {package}: {current_tag} <- {previous_tag}')
 
-        cmd = [
-            'git',
-            'log',
-            f'{previous_tag}..{current_tag}',
-            '--oneline',
-            '--no-decorate',
-            '--no-color',
-            '--no-abbrev',
-            '--no-merges',
-            '--',
-            f"'{package}/*'",
-            f"'{package}/src/**/*'",
-            f"'{package}/tests/**/*'",
-        ]
-        output = command(' '.join(cmd))
-
-        raw_commits = output.splitlines()
+        raw_commits = commits.get(current_version, [])
 
         if len(raw_commits) < 1:
             continue
@@ -1,7 +1,13 @@
 """Macro for executing commands."""
 
+from __future__ import annotations
+
 import subprocess
 from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
 
 
 def command(cmd: str | list[str], *, cwd: str | Path | None = None) -> str:
@@ -13,3 +19,12 @@ def command(cmd: str | list[str], *, cwd: str | Path | None = None) -> str:
     output = subprocess.run(cmd, check=False, capture_output=True, shell=shell, cwd=cwd)
 
     return output.stdout.decode('utf-8').strip()
+
+
+def stream_command(cmd: list[str], *, cwd: str | Path | None = None, bufsize: int = 1 << 20) -> Iterator[str]:
+    """Yield output lines as the command produces them, without keeping all of the output in memory."""
+    with subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, cwd=cwd, bufsize=bufsize, encoding='utf-8') as process:
+        assert process.stdout is not None
+
+        for line in process.stdout:
+            yield line.rstrip('\n')
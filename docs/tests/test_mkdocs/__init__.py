@@ -0,0 +1 @@
+"""Commence initialization of module."""
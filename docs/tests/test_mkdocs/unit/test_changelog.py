@@ -0,0 +1,129 @@
+"""Unit tests of grizzly_mkdocs.macros.changelog."""
+
+from __future__ import annotations
+
+import subprocess
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+import pytest
+from grizzly_mkdocs.macros.command import command
+
+if TYPE_CHECKING:  # pragma: no cover
+    from pathlib import Path
+
+    from pytest_mock import MockerFixture
+
+# grizzly_mkdocs.macros exports the changelog function with the same name as the module
+changelog_module = import_module('grizzly_mkdocs.macros.changelog')
+
+
+def git(cwd: Path, *args: str) -> str:
+    return subprocess.check_output(['git', *args], cwd=cwd, text=True).strip()  # noqa: S607
+
+
+def commit(repo: Path, message: str, *, tag: str | None = None, file: str = 'file.txt') -> str:
+    with (repo / 'p' / file).open('a') as fd:
+        fd.write(f'{message}\n')
+
+    git(repo, 'add', '.')
+    git(repo, 'commit', '--quiet', '-m', message)
+
+    if tag is not None:
+        git(repo, 'tag', tag)
+
+    return git(repo, 'rev-parse', 'HEAD')
+
+
+@pytest.fixture
+def repo(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    (tmp_path / 'p').mkdir()
+
+    git(tmp_path, 'init', '--quiet')
+    git(tmp_path, 'config', 'user.name', 'test')
+    git(tmp_path, 'config', 'user.email', 'test@example.com')
+    git(tmp_path, 'config', 'commit.gpgsign', 'false')
+    git(tmp_path, 'remote', 'add', 'origin', 'git@github.com:example/repo.git')
+
+    commit(tmp_path, 'initial', tag='p@v1.0.0')
+    commit(tmp_path, 'feature one', tag='p@v1.1.0')
+
+    monkeypatch.chdir(tmp_path)
+
+    return tmp_path
+
+
+def mock_head_version(mocker: MockerFixture, version: str) -> None:
+    def mocked_command(cmd: str | list[str], **kwargs: Any) -> str:
+        if cmd == ['hatch', 'version']:
+            return version
+
+        return command(cmd, **kwargs)
+
+    mocker.patch.object(changelog_module, 'command', side_effect=mocked_command)
+
+
+def test_changelog_unreleased(repo: Path, mocker: MockerFixture) -> None:
+    commit_feature_two = commit(repo, 'feature two', tag='p@v1.2.0')
+    commit_fix = commit(repo, 'fix after release')
+    mock_head_version(mocker, '1.2.1.dev1')
+
+    markdown = changelog_module.changelog('p', 'p').splitlines()
+
+    assert [line for line in markdown if line.startswith('## ')] == [
+        '## v1.2.1.dev1 **unreleased**{.chip-feature .danger}',
+        '## v1.2.0',
+        '## v1.1.0',
+    ]
+    assert f'- <a href="https://github.com/example/repo/commit/{commit_fix}" target="_blank">`{commit_fix[:8]}`</a> fix after release' in markdown
+    assert f'- <a href="https://github.com/example/repo/commit/{commit_feature_two}" target="_blank">`{commit_feature_two[:8]}`</a> feature two' in markdown
+
+
+def test_changelog_head_on_latest_release(repo: Path, mocker: MockerFixture) -> None:
+    commit_feature_two = commit(repo, 'feature two', tag='p@v1.2.0')
+    mock_head_version(mocker, '1.2.0')
+
+    markdown = changelog_module.changelog('p', 'p').splitlines()
+
+    assert [line for line in markdown if line.startswith('## ')] == [
+        '## v1.2.0 **current**{.chip-feature .info}',
+        '## v1.1.0',
+    ]
+    assert sum(commit_feature_two in line for line in markdown) == 1
+
+
+def test_changelog_pre_release(repo: Path, mocker: MockerFixture) -> None:
+    commit(repo, 'feature two', tag='p@v1.2.0rc1')
+    commit(repo, 'fix in release candidate', tag='p@v1.2.0')
+    mock_head_version(mocker, '1.2.0')
+
+    markdown = changelog_module.changelog('p', 'p').splitlines()
+
+    assert [line for line in markdown if line.startswith('## ')] == [
+        '## v1.2.0 **current**{.chip-feature .info}',
+        '## v1.2.0rc1',
+        '## v1.1.0',
+    ]
+
+
+def test_changelog_merged_release_branch(repo: Path, mocker: MockerFixture) -> None:
+    git(repo, 'checkout', '--quiet', '-b', 'release')
+    commit_release_fix = commit(repo, 'fix on release branch', tag='p@v1.2.0', file='release.txt')
+    git(repo, 'checkout', '--quiet', '-')
+    commit_main = commit(repo, 'feature on main')
+    git(repo, 'merge', '--quiet', '--no-ff', '--no-edit', 'release')
+    commit_after_merge = commit(repo, 'feature after merge', tag='p@v1.3.0')
+    mock_head_version(mocker, '1.3.0')
+
+    markdown = changelog_module.changelog('p', 'p')
+    sections = {section.split('\n', 1)[0]: section for section in markdown.split('## ') if section}
+
+    assert list(sections.keys()) == ['v1.3.0 **current**{.chip-feature .info}', 'v1.2.0', 'v1.1.0']
+
+    # commits belongs to the first version they are reachable from, not where they end up in the history
+    v1_3_0 = sections['v1.3.0 **current**{.chip-feature .info}']
+    assert commit_main in v1_3_0
+    assert commit_after_merge in v1_3_0
+    assert commit_release_fix not in v1_3_0
+    assert commit_release_fix in sections['v1.2.0']
+    assert commit_main not in sections['v1.2.0']
@@ -1,6 +1,3 @@
-from importlib.metadata import PackageNotFoundError, version
+from grizzly_ls.__version__ import __version__
 
-try:
-    __version__ = version('grizzly-loadtester-ls')
-except PackageNotFoundError:  # pragma: no cover
-    __version__ = 'unknown'
+__all__ = ['__version__']
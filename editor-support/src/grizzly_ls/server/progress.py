@@ -1,7 +1,8 @@
 from __future__ import annotations
 
+from itertools import count
+from os import getpid
 from typing import TYPE_CHECKING, Any
-from uuid import uuid4
 
 from lsprotocol import types as lsp
 from typing_extensions import Self
@@ -15,6 +16,11 @@ if TYPE_CHECKING:  # pragma: no cover
     from grizzly_ls.utils import LogOutputChannelLogger
 
 
+# tokens only has to be unique in the language server session, so no need for an uuid
+_token_counter = count()
+_token_prefix = f'grizzly-ls-{getpid()}-'
+
+
 class Progress:
     progress: PyglsProgress
     title: str
@@ -24,7 +30,7 @@ class Progress:
     def __init__(self, ls: GrizzlyLanguageServer, title: str) -> None:
         self.progress = ls.progress
         self.title = title
-        self.token = str(uuid4())
+        self.token = f'{_token_prefix}{next(_token_counter)}'
         self.logger = ls.logger
 
     @staticmethod
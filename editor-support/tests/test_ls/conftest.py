@@ -30,16 +30,22 @@ def _lsp_fixture() -> Generator[LspFixture, None, None]:
 
 lsp_fixture = pytest.fixture(scope='session')(_lsp_fixture)
 
-GRIZZLY_PROJECT = (Path(__file__) / '..' / '..' / '..' / 'tests' / 'project').resolve()
+GRIZZLY_PROJECT = Path(__file__).parents[2] / 'tests' / 'project'
 
 assert GRIZZLY_PROJECT.is_dir()
 
 
 # give E2E tests a little bit more time
 def pytest_collection_modifyitems(items: list[pytest.Function]) -> None:
+    timeout_marker = pytest.mark.timeout(300)
+
     for item in items:
-        if 'e2e' in item.path.as_posix() and item.get_closest_marker('timeout') is None:
-            item.add_marker(pytest.mark.timeout(300))
+        # only look up markers for e2e tests, get_closest_marker walks all parent nodes
+        if 'e2e' not in item.path.parts:
+            continue
+
+        if item.get_closest_marker('timeout') is None:
+            item.add_marker(timeout_marker)
 
 
 @pytest.fixture
@@ -8,7 +8,7 @@ from importlib import reload as reload_module
 from logging import DEBUG
 from pathlib import Path
 from threading import Thread
-from typing import TYPE_CHECKING, Any, Literal
+from typing import TYPE_CHECKING, Any, ClassVar, Literal
 
 from grizzly_ls.server.progress import Progress
 from grizzly_ls.utils import LogOutputChannelLogger
@@ -81,7 +81,13 @@ class LspFixture:
 
     datadir: Path
 
+    _behave_runtime_reset: ClassVar[bool] = False
+
     def _reset_behave_runtime(self) -> None:
+        # reloading modules is expensive, and only needed once per process
+        if LspFixture._behave_runtime_reset:
+            return
+
         from behave import step_registry
 
         step_registry.setup_step_decorators(None, step_registry.registry)
@@ -90,6 +96,8 @@ class LspFixture:
 
         reload_module(parse)
 
+        LspFixture._behave_runtime_reset = True
+
     def __enter__(self) -> Self:
         self._reset_behave_runtime()
         cstdio, cstdout = os.pipe()
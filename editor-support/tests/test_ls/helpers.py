@@ -106,6 +106,7 @@ def parse_enum_indirect(text: str) -> MessageDirection:
 
 def ANY(*cls: type, message: str | None = None) -> object:  # noqa: N802
     """Compare equal to everything, as long as it is of the same type."""
+    hash_value = hash((cls, message))
 
     class WrappedAny(metaclass=ABCMeta):  # noqa: B024
         def __eq__(self, other: object) -> bool:
@@ -130,7 +131,7 @@ def ANY(*cls: type, message: str | None = None) -> object:  # noqa: N802
             return ''.join(representation)
 
         def __hash__(self) -> int:
-            return hash(self)
+            return hash_value
 
     for c in cls:
         WrappedAny.register(c)
@@ -153,18 +154,14 @@ def SOME(cls: type, *value: Any, **values: Any) -> object:  # noqa: N802
     if len(value) > 0 and isinstance(value[0], dict):
         values = {**value[0]}
 
+    # cls and values are fixed, no need to resolve these on every comparison
+    get_value: Callable[[Any, str], Any] = dict.get if issubclass(cls, dict) else getattr
+    items = tuple(values.items())
+    hash_value = hash((cls, tuple(sorted((key, repr(value)) for key, value in items))))
+
     class WrappedSome(metaclass=ABCMeta):  # noqa: B024
         def __eq__(self, other: object) -> bool:
-            if issubclass(cls, dict):
-
-                def get_value(other: Any, attr: str) -> Any:
-                    return other.get(attr)
-            else:
-
-                def get_value(other: Any, attr: str) -> Any:
-                    return getattr(other, attr)
-
-            return isinstance(other, cls) and all(get_value(other, attr) == value for attr, value in values.items())
+            return isinstance(other, cls) and all(get_value(other, attr) == value for attr, value in items)
 
         def __ne__(self, other: object) -> bool:
             return not self.__eq__(other)
@@ -177,7 +174,7 @@ def SOME(cls: type, *value: Any, **values: Any) -> object:  # noqa: N802
             return f'<SOME({cls.__name__}, {info})>'
 
         def __hash__(self) -> int:
-            return hash(self)
+            return hash_value
 
     WrappedSome.register(cls)
 
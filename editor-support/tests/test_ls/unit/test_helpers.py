@@ -0,0 +1,23 @@
+"""Unit tests of test_ls.helpers."""
+
+from __future__ import annotations
+
+from test_ls.helpers import ANY, SOME
+
+
+def test_any_hash() -> None:
+    assert hash(ANY(str)) == hash(ANY(str))
+    assert hash(ANY(str, message='foo')) == hash(ANY(str, message='foo'))
+
+    values = {ANY(str), ANY(str, message='foo')}
+    assert len(values) == 2
+    assert all(value == 'foo' for value in values)
+
+
+def test_some_hash() -> None:
+    assert hash(SOME(dict, a=1)) == hash(SOME(dict, a=1))
+    assert hash(SOME(dict, {'a': 1})) == hash(SOME(dict, a=1))
+
+    values = {SOME(dict, a=1), SOME(dict, a=2)}
+    assert len(values) == 2
+    assert sorted(value == {'a': 1, 'b': 2} for value in values) == [False, True]
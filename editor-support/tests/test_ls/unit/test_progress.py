@@ -23,6 +23,7 @@ def test_progress(lsp_fixture: LspFixture, mocker: MockerFixture) -> None:
     assert progress.title == 'test'
     assert progress.logger is server.logger
     assert isinstance(progress.token, str)
+    assert Progress(server, title='test').token != progress.token
 
     report_spy = mocker.spy(progress, 'report')
     progress_create_mock = mocker.patch.object(progress.progress, 'create', return_value=None)
@@ -3,6 +3,7 @@
 # /// script
 # requires-python = ">=3.13"
 # dependencies = [
+#    "orjson>=3.8.0",
 #    "pyyaml>=6.0.2",
 # ]
 # ///
@@ -24,17 +25,23 @@ Environment Variables:
 
 import argparse
 import json
+import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import suppress
-from dataclasses import asdict, dataclass
-from operator import itemgetter
+from dataclasses import dataclass
+from functools import cache
+from operator import attrgetter
 from os import environ
 from pathlib import Path
 from typing import Any, TypedDict
 
+import orjson
 import tomllib
 import yaml
 
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
 
 @dataclass(eq=True, frozen=True)
 class ChangeE2eTests:
@@ -93,6 +100,25 @@ class Changes(TypedDict):
     uv: set[Change]
 
 
+def _find_test_directory(directory_path: Path) -> Path | None:
+    """Find the first test package directory in a package.
+
+    Args:
+        directory_path: Path to the package directory
+
+    Returns:
+        Path to the first 'tests/test_*' directory, or None if there is none
+
+    """
+    with suppress(FileNotFoundError, NotADirectoryError), os.scandir(directory_path / 'tests') as entries:
+        for entry in entries:
+            if entry.name.startswith('test_') and entry.is_dir(follow_symlinks=False):
+                return Path(entry.path)
+
+    return None
+
+
+@cache
 def _create_python_change(directory: str, package: str) -> Change:
     """Create a Change object for a Python package by detecting its test structure.
 
@@ -111,13 +137,14 @@ def _create_python_change(directory: str, package: str) -> Change:
         - Unit tests: 'tests/test_*/unit/'
         - E2E tests: 'tests/test_*/e2e/'
         - For 'grizzly-loadtester', both local and dist e2e tests are configured
+        - Results are cached, since a package is probed both when it changed and for each changed dependency
 
     """
     directory_path = Path(directory)
 
-    try:
-        test_directory = next(iter([test_base for test_base in Path.joinpath(directory_path, 'tests').glob('test_*') if test_base.is_dir()]))
-    except StopIteration:  # no tests and/or tests/test_ directories, ergo: no tests
+    test_directory = _find_test_directory(directory_path)
+
+    if test_directory is None:  # no tests and/or tests/test_ directories, ergo: no tests
         return Change(directory=directory, package=package, tests=ChangeTests(unit='', e2e=ChangeE2eTests(local='', dist='')))
 
     test_unit_directory = Path.joinpath(test_directory, 'unit')
@@ -141,7 +168,53 @@ def _create_python_change(directory: str, package: str) -> Change:
     return Change(directory=directory, package=package, tests=tests)
 
 
-def python_package(directory: str, uv_lock_package: list[dict[str, Any]], *, release: bool) -> set[Change]:
+def _load_workspace_packages(uv_lock_file: Path) -> list[dict[str, Any]]:
+    """Load the workspace packages from an uv.lock file.
+
+    Only the `[[package]]` entries for `grizzly-*` packages are parsed, the rest of the lock file
+    (mostly sdist and wheel metadata for third party packages) is skipped without being parsed.
+
+    Args:
+        uv_lock_file: Path to uv.lock file
+
+    Returns:
+        List of workspace packages from uv.lock file
+
+    """
+    _, *chunks = uv_lock_file.read_text(encoding='utf-8').split('\n[[package]]\n')
+    workspace_chunks = [chunk for chunk in chunks if chunk.startswith('name = "grizzly-')]
+
+    if len(workspace_chunks) < 1:
+        return []
+
+    uv_lock = tomllib.loads(''.join(f'[[package]]\n{chunk}\n' for chunk in workspace_chunks))
+    uv_lock_package: list[dict[str, Any]] = uv_lock.get('package', [])
+
+    return uv_lock_package
+
+
+def _create_dependents(workspace_packages: list[dict[str, Any]]) -> dict[str, list[tuple[str, str]]]:
+    """Create an index of which workspace packages depends on a package.
+
+    Args:
+        workspace_packages: List of workspace packages from uv.lock file, see `_load_workspace_packages`
+
+    Returns:
+        Map of package name to list of (package, directory) tuples for workspace packages that depends on it
+
+    """
+    dependents: dict[str, list[tuple[str, str]]] = {}
+
+    for value in workspace_packages:
+        name = value['name']
+
+        for dependency in value.get('dependencies', []):
+            dependents.setdefault(dependency['name'], []).append((name, value['source']['editable']))
+
+    return dependents
+
+
+def python_package(directory: str, dependents: dict[str, list[tuple[str, str]]], *, release: bool) -> set[Change]:
     """Detect changes in a Python package and its reverse dependencies.
 
     Analyzes a directory for Python package configuration and identifies
@@ -150,7 +223,7 @@ def python_package(directory: str, uv_lock_package: list[dict[str, Any]], *, rel
 
     Args:
         directory: Path to the directory to analyze
-        uv_lock_package: List of packages from uv.lock file
+        dependents: Map of package name to workspace packages that depends on it
         release: If True, only include packages with release configuration
 
     Returns:
@@ -162,36 +235,26 @@ def python_package(directory: str, uv_lock_package: list[dict[str, Any]], *, rel
         - Automatically includes workspace packages that depend on this package
 
     """
-    changes: set[Change] = set()
-
     directory_path = Path(directory)
     pyproject_file = directory_path / 'pyproject.toml'
 
-    if not pyproject_file.exists():
-        return changes
-
-    with pyproject_file.open('rb') as pyproject_fd:
-        pyproject = tomllib.load(pyproject_fd)
-        project = pyproject.get('project', {})
-
-        if release and pyproject.get('tool', {}).get('hatch', {}).get('version', {}).get('raw-options', {}).get('scm', {}).get('git', {}).get('describe_command', None) is None:
-            return changes
+    try:
+        with pyproject_file.open('rb') as pyproject_fd:
+            pyproject = tomllib.load(pyproject_fd)
+    except FileNotFoundError:
+        return set()
 
-        package = project.get('name', None)
+    project = pyproject.get('project', {})
 
-        changes.add(_create_python_change(directory, package))
+    if release and pyproject.get('tool', {}).get('hatch', {}).get('version', {}).get('raw-options', {}).get('scm', {}).get('git', {}).get('describe_command', None) is None:
+        return set()
 
-        # workspace packages that has dependencies on this package
-        for value in uv_lock_package:
-            if not (value.get('name', '').startswith('grizzly-') and any(dependency['name'] == package for dependency in value.get('dependencies', []))):
-                continue
+    package = project.get('name', None)
 
-            reverse_package: str = value['name']
-            reverse_directory: str = value['source']['editable']
+    # the package itself, and workspace packages that has dependencies on it
+    targets = [(directory, package), *((reverse_directory, reverse_package) for reverse_package, reverse_directory in dependents.get(package, []))]
 
-            changes.add(_create_python_change(reverse_directory, reverse_package))
-
-    return changes
+    return {_create_python_change(target_directory, target_package) for target_directory, target_package in targets}
 
 
 def node_package(directory: str, *, release: bool) -> set[Change]:
@@ -215,32 +278,47 @@ def node_package(directory: str, *, release: bool) -> set[Change]:
     """
     changes: set[Change] = set()
 
-    package_json_file = Path(directory) / 'package.json'
-    if not package_json_file.exists():
+    directory_path = Path(directory)
+    package_json_file = directory_path / 'package.json'
+    try:
+        package_json = orjson.loads(package_json_file.read_bytes())
+    except FileNotFoundError:
         return changes
 
-    package_local_json_file = Path(directory) / 'package.local.json'
+    package_local_json_file = directory_path / 'package.local.json'
     if not package_local_json_file.exists() and release:
         return changes
 
-    with package_local_json_file.open('r') as fd:
-        package_local_json = json.loads(fd.read())
+    package_local_json = orjson.loads(package_local_json_file.read_bytes())
 
-        if package_local_json.get('tag', {}).get('pattern', None) is None:
-            return changes
+    if package_local_json.get('tag', {}).get('pattern', None) is None:
+        return changes
 
-    with package_json_file.open('r') as fd:
-        package_json = json.loads(fd.read())
-        package_scripts = package_json.get('scripts', {})
+    package_scripts = package_json.get('scripts') or {}
 
-        args_unit: str = 'tests' if 'tests' in package_scripts else ''
-        args_e2e: str = 'e2e-tests' if 'e2e-tests' in package_scripts else ''
+    args_unit: str = 'tests' if 'tests' in package_scripts else ''
+    args_e2e: str = 'e2e-tests' if 'e2e-tests' in package_scripts else ''
 
-        changes.add(Change(directory=directory, package=package_json['name'], tests=ChangeTests(args_unit, e2e=ChangeE2eTests(local=args_e2e, dist=''))))
+    changes.add(Change(directory=directory, package=package_json['name'], tests=ChangeTests(args_unit, e2e=ChangeE2eTests(local=args_e2e, dist=''))))
 
     return changes
 
 
+def directory_changes(directory: str, dependents: dict[str, list[tuple[str, str]]], *, release: bool) -> tuple[set[Change], set[Change]]:
+    """Detect Python and Node.js package changes in a directory.
+
+    Args:
+        directory: Path to the directory to analyze
+        dependents: Map of package name to workspace packages that depends on it
+        release: If True, only include packages with release configuration
+
+    Returns:
+        Tuple with set of uv changes and set of npm changes
+
+    """
+    return python_package(directory, dependents, release=release), node_package(directory, release=release)
+
+
 def main() -> int:
     """Process command-line arguments and map package changes to test configurations.
 
@@ -273,7 +351,7 @@ def main() -> int:
     args = parser.parse_args()
 
     if args.force == 'true':
-        change_filters_file = Path.joinpath(Path(__file__).parent.parent.parent, '.github', 'change-filters.yaml')
+        change_filters_file = REPO_ROOT / '.github' / 'change-filters.yaml'
         with change_filters_file.open('r') as fd:
             change_filters = yaml.safe_load(fd)
             workflow_input = list(change_filters.keys())
@@ -290,22 +368,27 @@ def main() -> int:
         return 1
 
     changes: Changes = {'uv': set(), 'npm': set()}
-    uv_lock_file = (Path(__file__).parent / '..' / '..' / 'uv.lock').resolve()
+    uv_lock_file = REPO_ROOT / 'uv.lock'
 
-    with uv_lock_file.open('rb') as fd:
-        uv_lock = tomllib.load(fd)
-        uv_lock_package: list[dict[str, Any]] = uv_lock.get('package', {})
+    # only the workspace packages in uv.lock are parsed, the rest of it is skipped
+    workspace_packages = _load_workspace_packages(uv_lock_file)
+    dependents = _create_dependents(workspace_packages)
 
-        for directory in workflow_input:
-            changes['uv'].update(python_package(directory, uv_lock_package, release=args.release))
-            changes['npm'].update(node_package(directory, release=args.release))
+    # reading package files is I/O bound, so check all directories concurrently
+    with ThreadPoolExecutor(max_workers=max(1, min(32, len(workflow_input)))) as executor:
+        futures = [executor.submit(directory_changes, directory, dependents, release=args.release) for directory in workflow_input]
 
-        if len(changes) < 1:
-            print('no changes detected in known locations', file=sys.stderr)
-            return 1
+        for future in futures:
+            uv_changes, npm_changes = future.result()
+            changes['uv'].update(uv_changes)
+            changes['npm'].update(npm_changes)
+
+    if len(changes) < 1:
+        print('no changes detected in known locations', file=sys.stderr)
+        return 1
 
-    changes_npm = json.dumps(sorted([asdict(change) for change in changes['npm']], key=itemgetter('package')))
-    changes_uv = json.dumps(sorted([asdict(change) for change in changes['uv']], key=itemgetter('package')))
+    changes_npm = orjson.dumps(sorted(changes['npm'], key=attrgetter('package'))).decode()
+    changes_uv = orjson.dumps(sorted(changes['uv'], key=attrgetter('package'))).decode()
 
     print(f'detected changes:\nuv={changes_uv}\nnpm={changes_npm}')
 
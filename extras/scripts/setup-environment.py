@@ -33,21 +33,24 @@ def main() -> int:
 
     if args.paths is not None:
         with Path(environ['GITHUB_PATH']).open('a') as fd:
-            fd.writelines(f'{path}\n' for path in args.paths)
+            fd.write(''.join(f'{path}\n' for path in args.paths))
 
         paths_info = jsondumps(args.paths, indent=2)
         print(f'Added paths to PATH variable:\n{paths_info}')
 
     if args.env_vars is not None:
+        env_lines: list[str] = []
+        for env_var in args.env_vars:
+            key, value = env_var.split('=', 1)
+            if key in ['LD_LIBRARY_PATH']:
+                current_value = environ.get(key, '')
+                if current_value:
+                    value = f'{value}{pathsep}{current_value}'
+
+            env_lines.append(f'{key}={value}\n')
+
         with Path(environ['GITHUB_ENV']).open('a') as fd:
-            for env_var in args.env_vars:
-                key, value = env_var.split('=', 1)
-                if key in ['LD_LIBRARY_PATH']:
-                    current_value = environ.get(key, '')
-                    if current_value:
-                        value = f'{value}{pathsep}{current_value}'
-
-                fd.write(f'{key}={value}\n')
+            fd.write(''.join(env_lines))
 
         env_var_info = jsondumps(args.env_vars, indent=2)
         print(f'Added environment variables:\n{env_var_info}')
@@ -1,22 +1,25 @@
-"""Any import from a grizzly module should intialize version (grizzly and locust) variables."""
+"""Any import from a grizzly module should intialize version (grizzly and locust) variables.
 
-from gevent import monkey
+Importing grizzly will gevent monkey patch the standard library, unless environment variable `GRIZZLY_MONKEY_PATCH`
+is set to `false`, e.g. for tooling that only needs the version variables.
+"""
 
-monkey.patch_all()
+from os import environ
+
+if environ.get('GRIZZLY_MONKEY_PATCH', 'true').lower() != 'false':
+    from gevent import monkey
+
+    monkey.patch_all()
 
 from importlib.metadata import PackageNotFoundError, version
 
-try:
-    __version__ = version('grizzly-loadtester')
-except PackageNotFoundError:
-    __version__ = 'unknown'
+from grizzly_common.__version__ import __version__ as __common_version__
 
-try:
-    __common_version__ = version('grizzly-loadtester-common')
-except PackageNotFoundError:
-    __common_version__ = 'unknown'
+from grizzly.__version__ import __version__
 
 try:
     __locust_version__ = version('locust')
 except PackageNotFoundError:  # pragma: no cover
     __locust_version__ = 'unknown'
+
+__all__ = ['__common_version__', '__locust_version__', '__version__']
@@ -4,8 +4,9 @@ from __future__ import annotations
 
 import logging
 from os import environ
-from secrets import choice
+from random import Random
 from typing import TYPE_CHECKING, Any, cast
+from unittest.mock import DEFAULT
 
 import pytest
 from grizzly.auth import RefreshTokenDistributor
@@ -50,9 +51,7 @@ def _listener_test_mocker(mocker: MockerFixture, noop_zmq: NoopZmqFixture) -> No
 
     mocker.patch('locust.runners.rpc.Client.__init__', return_value=None)
     mocker.patch('locust.runners.rpc.BaseSocket.send', autospec=True)
-    mocker.patch('locust.runners.WorkerRunner.heartbeat', autospec=True)
-    mocker.patch('locust.runners.WorkerRunner.worker', autospec=True)
-    mocker.patch('locust.runners.WorkerRunner.connect_to_master', autospec=True)
+    mocker.patch.multiple('locust.runners.WorkerRunner', heartbeat=DEFAULT, worker=DEFAULT, connect_to_master=DEFAULT, autospec=True)
     mocker.patch('locust.runners.MasterRunner.client_listener', autospec=True)
 
 
@@ -350,13 +349,14 @@ def test_validate_result(mocker: MockerFixture, caplog: LogCaptureFixture, grizz
     environment = grizzly.state.locust.environment
 
     environment.stats = RequestStats()
+    rng = Random(0)  # noqa: S311
     for method, name in [
         ('POST', '001 OAuth2 client token'),
         ('POST', '001 Register'),
         ('GET', '001 Read'),
     ]:
         for i in range(100):
-            environment.stats.log_request(method, name, choice(range(10, 57)), len(name))
+            environment.stats.log_request(method, name, rng.randrange(10, 57), len(name))
             if i % 5 == 0:
                 environment.stats.log_error(method, name, RuntimeError('Error'))
 
@@ -0,0 +1,42 @@
+"""Unit tests for grizzly."""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+from os import environ
+
+import pytest
+
+
+@pytest.mark.parametrize(
+    ('value', 'expected'),
+    [
+        (None, 'True True'),
+        ('true', 'True True'),
+        ('1', 'True True'),
+        ('yes', 'True True'),
+        ('false', 'False False'),
+        ('False', 'False False'),
+    ],
+)
+def test_monkey_patch(value: str | None, expected: str) -> None:
+    env = environ.copy()
+    env.pop('GRIZZLY_MONKEY_PATCH', None)
+
+    if value is not None:
+        env['GRIZZLY_MONKEY_PATCH'] = value
+
+    # must run in a separate process, since the test process is already monkey patched
+    output = subprocess.check_output(
+        [
+            sys.executable,
+            '-c',
+            ('import sys;import grizzly;gevent_imported = "gevent" in sys.modules;from gevent import monkey;print(gevent_imported, monkey.is_module_patched("socket"))'),
+        ],
+        env=env,
+        stderr=subprocess.STDOUT,
+        text=True,
+    )
+
+    assert output.strip() == expected
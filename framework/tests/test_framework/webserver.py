@@ -5,9 +5,9 @@ from __future__ import annotations
 import csv
 import json
 import logging
-import socket
 from contextlib import suppress
 from pathlib import Path
+from threading import Lock
 from time import perf_counter, time
 from typing import TYPE_CHECKING, Any, Literal, cast
 
@@ -16,6 +16,7 @@ import requests
 from flask import Flask, jsonify, request
 from flask import Request as FlaskRequest
 from flask import Response as FlaskResponse
+from gevent.pool import Pool
 from gevent.pywsgi import WSGIServer
 from werkzeug.datastructures import Headers as FlaskHeaders
 
@@ -85,6 +86,22 @@ def app_get_cat_fact() -> FlaskResponse:
     return jsonify(['meow meow meow'])
 
 
+_books: dict[str, dict[str, str]] | None = None
+_books_lock = Lock()
+
+
+def _load_books() -> dict[str, dict[str, str]]:
+    global _books  # noqa: PLW0603
+
+    with _books_lock:
+        if _books is None:
+            books_file = root_dir / 'requests' / 'books' / 'books.csv'
+            with books_file.open() as fd:
+                _books = {row['book']: row for row in csv.DictReader(fd)}
+
+    return _books
+
+
 @app.route('/books/<book>.json')
 def app_get_book(book: str) -> FlaskResponse:
     logger.debug('/books/%s.json called, root_dir=%s', book, root_dir)
@@ -92,21 +109,18 @@ def app_get_book(book: str) -> FlaskResponse:
     if len(request.get_data(cache=False, as_text=True)) > 0:
         return FlaskResponse(status=403)
 
-    books_file = root_dir / 'requests' / 'books' / 'books.csv'
     try:
-        with books_file.open() as fd:
-            reader = csv.DictReader(fd)
-            for row in reader:
-                if row['book'] == book:
-                    return jsonify(
-                        {
-                            'number_of_pages': row['pages'],
-                            'isbn_10': [row['isbn_10']] * 2,
-                            'authors': [
-                                {'key': '/author/' + row['author'].replace(' ', '_').strip() + '|' + row['isbn_10'].strip()},
-                            ],
-                        },
-                    )
+        row = _load_books().get(book, None)
+        if row is not None:
+            return jsonify(
+                {
+                    'number_of_pages': row['pages'],
+                    'isbn_10': [row['isbn_10']] * 2,
+                    'authors': [
+                        {'key': '/author/' + row['author'].replace(' ', '_').strip() + '|' + row['isbn_10'].strip()},
+                    ],
+                },
+            )
     except Exception:
         logger.exception('request failed')
 
@@ -302,20 +316,26 @@ def app_write() -> FlaskResponse:
     return response
 
 
+# unknown routes responds with an empty json object, same response every time so only create it once
+not_found_response = app.response_class(b'{}', status=200, mimetype='application/json')
+
+
 @app.errorhandler(404)
 def catch_all(_: Any) -> FlaskResponse:
-    return jsonify({}, status=200)
+    return not_found_response
 
 
 class Webserver:
     _web_server: WSGIServer
-    _greenlet: gevent.Greenlet
+    _pool: Pool
 
     def __init__(self, port: int = 0) -> None:
+        self._pool = Pool(1000)
         self._web_server = WSGIServer(
             ('0.0.0.0', port),
             app,
             log=None,
+            spawn=self._pool,
         )
         logger.debug('created webserver on port %d', port)
 
@@ -335,17 +355,6 @@ class Webserver:
     def auth_provider_uri(self) -> str:
         return '/oauth2/v2.0'
 
-    def wait_for_start(self, timeout: int = 10) -> None:
-        start_time = time()
-        while time() - start_time < timeout:
-            with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
-                if sock.connect_ex(('127.0.0.1', self.port)) == 0:
-                    return
-                gevent.sleep(0.5)
-
-        message = f'webserver did not start on port {self.port}'
-        raise RuntimeError(message)
-
     def wait_for_health(self, timeout: int = 300) -> None:
         start_time = time()
         while time() - start_time < timeout:
@@ -366,8 +375,8 @@ class Webserver:
             global logger  # noqa: PLW0603
             logger = logger_
 
-        self._greenlet = gevent.spawn(lambda: self._web_server.serve_forever())
-        self.wait_for_start()
+        # binds the listener and starts accepting connections before returning, requests are handled by greenlets from the pool
+        self._web_server.start()
         self.wait_for_health()
         logger.debug('started webserver on port %d', self.port)
 
@@ -392,4 +401,4 @@ class Webserver:
 
 if __name__ == '__main__':
     with Webserver(port=8080) as webserver:
-        gevent.joinall([webserver._greenlet])
+        webserver._web_server.serve_forever()
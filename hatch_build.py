@@ -5,6 +5,7 @@ from __future__ import annotations
 import subprocess
 from os import environ
 from pathlib import Path
+from shutil import which
 from typing import Any
 
 from hatchling.builders.hooks.plugin.interface import BuildHookInterface
@@ -17,9 +18,10 @@ class BuildGrizzly(BuildHookInterface):
             try:
                 target = 'clients/vscode'
                 print(f'Building {target}')
-                subprocess.check_output('npm install', cwd=target, shell=True, stderr=subprocess.STDOUT)
+                # resolve npm explicitly, on windows it is a npm.cmd script that can not be executed without a shell
+                subprocess.run([which('npm') or 'npm', 'install'], cwd=target, check=True, capture_output=True, text=True)
             except subprocess.CalledProcessError as e:
-                message = f'"{e.cmd}" got exit code {e.returncode}: {e.output}'
+                message = f'"{" ".join(e.cmd)}" got exit code {e.returncode}: {e.stderr}'
                 raise RuntimeError(message) from e
 
     def is_dynamic_readme(self) -> bool: